@@ -1,47 +1,47 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from enum import Enum, auto
+from enum import IntEnum
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from yamcs.pymdb.expressions import Expression
 
 
-class AlarmLevel(Enum):
+class AlarmLevel(IntEnum):
     """
     Alarm levels with increasing concern.
     """
 
-    NORMAL = auto()
+    NORMAL = 1
     """
     Used to indicate there is no concern.
     """
 
-    WATCH = auto()
+    WATCH = 2
     """
     Least concern. Considered to be below the more commonly used WARNING level.
     """
 
-    WARNING = auto()
+    WARNING = 3
     """
     Concern that represents the most commonly used minimum concern level for
     many software applications.
     """
 
-    DISTRESS = auto()
+    DISTRESS = 4
     """
     An alarm level of concern in-between the more commonly used WARNING and
     CRITICAL levels.
     """
 
-    CRITICAL = auto()
+    CRITICAL = 5
     """
     An alarm level of concern that represents the most commonly used maximum
     concern level for many software applications.
     """
 
-    SEVERE = auto()
+    SEVERE = 6
     """
     An alarm level of highest concern. Considered to be above the most commonly
     used Critical level.
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING
 
@@ -27,13 +28,15 @@ class Algorithm:
         outputs: Sequence[OutputParameter] | None = None,
         triggers: Sequence[Trigger] | None = None,
     ):
-        self.name: str = name
+        self.name: str = sys.intern(str(name)) if isinstance(name, str) else name
         """Short name of this algorithm"""
 
         self.system: System = system
         """System this algorithm belongs to"""
 
-        self.aliases: dict[str, str] = dict(aliases or {})
+        self._qualified_name: str | None = None
+
+        self.aliases: dict[str, str] = dict(aliases) if aliases else {}
         """Alternative names, keyed by namespace"""
 
         self.short_description: str | None = short_description
@@ -42,7 +45,7 @@ class Algorithm:
         self.long_description: str | None = long_description
         """Multiline description"""
 
-        self.extra: dict[str, str] = dict(extra or {})
+        self.extra: dict[str, str] = dict(extra) if extra else {}
         """Arbitrary information, keyed by name"""
 
         self.language: str = language
@@ -51,18 +54,16 @@ class Algorithm:
         self.text: str = text
         """Algorithm text"""
 
-        self.inputs: list[InputParameter] = list(inputs or [])
+        self.inputs: list[InputParameter] = list(inputs) if inputs else []
         """Parameter inputs available to the algorithm"""
 
-        self.outputs: list[OutputParameter] = list(outputs or [])
+        self.outputs: list[OutputParameter] = list(outputs) if outputs else []
         """Parameter outputs available to the algorithm"""
 
-        self.triggers: list[Trigger] = list(triggers or [])
+        self.triggers: list[Trigger] = list(triggers) if triggers else []
         """Algorithm triggers"""
 
-        if name in system._algorithms_by_name:
-            raise Exception(f"System already contains an algorithm {name}")
-        system._algorithms_by_name[name] = self
+        system._register(system._algorithms_by_name, "an algorithm", self)
 
     @property
     def qualified_name(self) -> str:
@@ -71,14 +72,9 @@ class Algorithm:
         an item ``C`` in a subystem ``B`` of a top-level system ``A`` is
         represented as ``/A/B/C``
         """
-        path = "/" + self.name
-
-        parent = self.system
-        while parent:
-            path = "/" + parent.name + path
-            parent = getattr(parent, "system", None)
-
-        return path
+        if self._qualified_name is None:
+            self._qualified_name = self.system.qualified_name + "/" + self.name
+        return self._qualified_name
 
     def __lt__(self, other: Algorithm) -> bool:
         return self.qualified_name < other.qualified_name
@@ -157,7 +153,7 @@ class UnnamedAlgorithm:
         self.language: str = language
         self.text: str = text
 
-        self.inputs: list[InputParameter] = list(inputs or [])
+        self.inputs: list[InputParameter] = list(inputs) if inputs else []
         """Parameter inputs available to the algorithm"""
 
         self.extra: AncillaryData
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Calibrator:
     """
     Transform a raw value (e.g. an integer count from a spacecraft) to an
@@ -9,7 +9,7 @@ class Calibrator:
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class Polynomial(Calibrator):
     """
     A calibration type where a curve in a raw vs calibrated plane is described
@@ -22,7 +22,7 @@ class Polynomial(Calibrator):
     """Coefficients ordered from X^0 to X^n"""
 
 
-@dataclass
+@dataclass(slots=True)
 class Interpolate(Calibrator):
     """
     One-dimensional piecewise interpolation. A segmented line in a raw vs
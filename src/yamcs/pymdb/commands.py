@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import Mapping, Sequence
-from enum import Enum, auto
+from enum import IntEnum
 from typing import TYPE_CHECKING, Any, Literal, Union
 
 from yamcs.pymdb.containers import ParameterEntry
@@ -20,26 +21,26 @@ from yamcs.pymdb.datatypes import (
     Member,
     StringDataType,
 )
-from yamcs.pymdb.encodings import Encoding, TimeEncoding
-from yamcs.pymdb.expressions import Expression
-from yamcs.pymdb.verifiers import (
-    AcceptedVerifier,
-    CompleteVerifier,
-    ExecutionVerifier,
-    FailedVerifier,
-    QueuedVerifier,
-    ReceivedVerifier,
-    SentFromRangeVerifier,
-    TransferredToRangeVerifier,
-    Verifier,
-)
 
 if TYPE_CHECKING:
     from yamcs.pymdb.calibrators import Calibrator
+    from yamcs.pymdb.encodings import Encoding, TimeEncoding
+    from yamcs.pymdb.expressions import Expression
     from yamcs.pymdb.systems import System
-
-
-class CommandLevel(Enum):
+    from yamcs.pymdb.verifiers import (
+        AcceptedVerifier,
+        CompleteVerifier,
+        ExecutionVerifier,
+        FailedVerifier,
+        QueuedVerifier,
+        ReceivedVerifier,
+        SentFromRangeVerifier,
+        TransferredToRangeVerifier,
+        Verifier,
+    )
+
+
+class CommandLevel(IntEnum):
     """
     The importance of a telecommand in terms of the nature and
     significance of its on-board effect.
@@ -47,26 +48,26 @@ class CommandLevel(Enum):
     These levels are adopted from ISO 14950:2004
     """
 
-    NORMAL = auto()
+    NORMAL = 1
     """
     Level D
     """
 
-    VITAL = auto()
+    VITAL = 2
     """
     Level C: Telecommands that are not critical, but essential to the success
     of the mission and, if sent at the wrong time, could cause momentary loss
     of the mission.
     """
 
-    CRITICAL = auto()
+    CRITICAL = 3
     """
     Level B: Telecommands that, if executed at the wrong time or in the wrong
     configuration, could cause irreversible loss or damage for the mission
     (i.e. endanger the achievement of the primary mission objectives)
     """
 
-    FORBIDDEN = auto()
+    FORBIDDEN = 4
     """
     Level A: Telecommands that are not expected to be used for nominal or
     foreseeable contingency operations, that are included for unforeseen
@@ -87,7 +88,7 @@ class Argument(DataType):
         units: str | None = None,
         encoding: Encoding | None = None,
     ) -> None:
-        self.name: str = name
+        self.name: str = sys.intern(str(name)) if isinstance(name, str) else name
         """Short name of this argument"""
 
         self.default: Any = default
@@ -390,6 +391,8 @@ class StringArgument(Argument, StringDataType):
 
 
 class ArgumentEntry:
+    __slots__ = ("argument", "short_description", "bitpos", "offset", "condition")
+
     def __init__(
         self,
         argument: Argument,
@@ -426,6 +429,16 @@ class ArgumentEntry:
 
 
 class FixedValueEntry:
+    __slots__ = (
+        "binary",
+        "name",
+        "short_description",
+        "bitpos",
+        "offset",
+        "condition",
+        "bits",
+    )
+
     def __init__(
         self,
         binary: bytes | str,
@@ -495,6 +508,8 @@ CommandEntry = ArgumentEntry | ParameterEntry | FixedValueEntry
 
 
 class TransmissionConstraint:
+    __slots__ = ("expression", "timeout")
+
     def __init__(self, expression: Expression, *, timeout: float = 0):
         self.expression: Expression = expression
         """Expression that must be satisfied"""
@@ -504,6 +519,32 @@ class TransmissionConstraint:
 
 
 class Command:
+    __slots__ = (
+        "name",
+        "system",
+        "_qualified_name",
+        "aliases",
+        "short_description",
+        "long_description",
+        "extra",
+        "abstract",
+        "base",
+        "assignments",
+        "arguments",
+        "constraints",
+        "_entries",
+        "transferred_to_range_verifier",
+        "sent_from_range_verifier",
+        "received_verifier",
+        "accepted_verifier",
+        "queued_verifier",
+        "execution_verifiers",
+        "complete_verifiers",
+        "failed_verifier",
+        "level",
+        "warning_message",
+    )
+
     def __init__(
         self,
         system: System,
@@ -524,13 +565,15 @@ class Command:
             Union[TransmissionConstraint, Sequence[TransmissionConstraint]] | None
         ) = None,
     ):
-        self.name: str = name
+        self.name: str = sys.intern(str(name)) if isinstance(name, str) else name
         """Short name of this command"""
 
         self.system: System = system
         """System this command belongs to"""
 
-        self.aliases: dict[str, str] = dict(aliases or {})
+        self._qualified_name: str | None = None
+
+        self.aliases: dict[str, str] = dict(aliases) if aliases else {}
         """Alternative names, keyed by namespace"""
 
         self.short_description: str | None = short_description
@@ -539,13 +582,13 @@ class Command:
         self.long_description: str | None = long_description
         """Multiline description"""
 
-        self.extra: dict[str, str] = dict(extra or {})
+        self.extra: dict[str, str] = dict(extra) if extra else {}
         """Arbitrary information, keyed by name"""
 
         self.abstract: bool = abstract
         self.base: Command | str | None = base
-        self.assignments: dict[str, Any] = dict(assignments or {})
-        self.arguments: list[Argument] = list(arguments or [])
+        self.assignments: dict[str, Any] = dict(assignments) if assignments else {}
+        self.arguments: list[Argument] = list(arguments) if arguments else []
 
         constraints: list[TransmissionConstraint] = []
         if isinstance(constraint, Sequence):
@@ -583,9 +626,7 @@ class Command:
         self.warning_message: str | None = warning_message
         """Message explaining the importance of this telecommand"""
 
-        if name in system._commands_by_name:
-            raise Exception(f"System already contains a command {name}")
-        system._commands_by_name[name] = self
+        system._register(system._commands_by_name, "a command", self)
 
     @property
     def verifiers(self) -> list[Verifier]:
@@ -613,14 +654,9 @@ class Command:
         an item ``C`` in a subystem ``B`` of a top-level system ``A`` is
         represented as ``/A/B/C``
         """
-        path = "/" + self.name
-
-        parent = self.system
-        while parent:
-            path = "/" + parent.name + path
-            parent = getattr(parent, "system", None)
-
-        return path
+        if self._qualified_name is None:
+            self._qualified_name = self.system.qualified_name + "/" + self.name
+        return self._qualified_name
 
     def get_argument(self, name: str, visit_parents=True):
         """
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING
 
@@ -12,6 +13,8 @@ if TYPE_CHECKING:
 
 
 class ParameterEntry:
+    __slots__ = ("parameter", "short_description", "bitpos", "offset", "condition")
+
     def __init__(
         self,
         parameter: Parameter,
@@ -51,6 +54,8 @@ class ParameterEntry:
 
 
 class ContainerEntry:
+    __slots__ = ("container", "short_description", "bitpos", "offset", "condition")
+
     def __init__(
         self,
         container: Container,
@@ -111,13 +116,15 @@ class Container:
         rate: float | None = None,
         hint_partition: bool = False,
     ):
-        self.name: str = name
+        self.name: str = sys.intern(str(name)) if isinstance(name, str) else name
         """Short name of this parameter"""
 
         self.system: System = system
         """System this container belongs to"""
 
-        self.aliases: dict[str, str] = dict(aliases or {})
+        self._qualified_name: str | None = None
+
+        self.aliases: dict[str, str] = dict(aliases) if aliases else {}
         """Alternative names, keyed by namespace"""
 
         self.short_description: str | None = short_description
@@ -126,7 +133,7 @@ class Container:
         self.long_description: str | None = long_description
         """Multiline description"""
 
-        self.extra: dict[str, str] = dict(extra or {})
+        self.extra: dict[str, str] = dict(extra) if extra else {}
         """Arbitrary information, keyed by name"""
 
         self.bits: int | None = bits
@@ -162,20 +169,15 @@ class Container:
         stored to Yamcs.
         """
 
-        self.entries: list[ParameterEntry | ContainerEntry] = list(entries or [])
+        self.entries: list[ParameterEntry | ContainerEntry] = (
+            list(entries) if entries else []
+        )
         self.base: Container | str | None = base
         self.abstract: bool = abstract
         self.condition: Expression | None = condition
         """Restriction criteria for this container."""
 
-        if name in system._containers_by_name:
-            raise Exception(
-                "System {} already contains a container {}".format(
-                    system.qualified_name, name
-                )
-            )
-
-        system._containers_by_name[name] = self
+        system._register(system._containers_by_name, "a container", self)
 
     @property
     def qualified_name(self) -> str:
@@ -184,14 +186,9 @@ class Container:
         an item ``C`` in a subystem ``B`` of a top-level system ``A`` is
         represented as ``/A/B/C``
         """
-        path = "/" + self.name
-
-        parent = self.system
-        while parent:
-            path = "/" + parent.name + path
-            parent = getattr(parent, "system", None)
-
-        return path
+        if self._qualified_name is None:
+            self._qualified_name = self.system.qualified_name + "/" + self.name
+        return self._qualified_name
 
     def fit_entries(self):
         """
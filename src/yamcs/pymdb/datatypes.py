@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum, auto
+from enum import Enum, IntEnum
 from typing import TYPE_CHECKING, Any, Literal, TypeAlias
 
 from yamcs.pymdb.encodings import Encoding, TimeEncoding
@@ -13,17 +14,17 @@ if TYPE_CHECKING:
     from yamcs.pymdb.parameters import AbsoluteTimeParameter, IntegerParameter
 
 
-class Epoch(Enum):
-    GPS = auto()
-    J2000 = auto()
-    TAI = auto()
-    UNIX = auto()
+class Epoch(IntEnum):
+    GPS = 1
+    J2000 = 2
+    TAI = 3
+    UNIX = 4
 
 
 Choices: TypeAlias = Sequence[tuple[int, str] | tuple[int, str, str]] | type[Enum]
 
 
-@dataclass
+@dataclass(slots=True)
 class DynamicInteger:
     parameter: IntegerParameter | str
     """
@@ -49,10 +50,12 @@ class DataType:
         self.long_description: str | None = long_description
         """Multiline description"""
 
-        self.extra: dict[str, str] = dict(extra or {})
+        self.extra: dict[str, str] = dict(extra) if extra else {}
         """Arbitrary information, keyed by name"""
 
-        self.units: str | None = units
+        self.units: str | None = (
+            sys.intern(str(units)) if isinstance(units, str) else units
+        )
         """Engineering units"""
 
         self.encoding: Encoding | None = encoding
@@ -342,7 +345,7 @@ class Member(DataType):
             encoding=encoding,
         )
 
-        self.name: str = name
+        self.name: str = sys.intern(str(name)) if isinstance(name, str) else name
         """Member name"""
 
         self.initial_value: Any = initial_value
@@ -1,56 +1,56 @@
 from __future__ import annotations
 
-from enum import Enum, auto
+from enum import IntEnum
 from typing import TYPE_CHECKING, TypeAlias
 
 if TYPE_CHECKING:
     from yamcs.pymdb.algorithms import UnnamedAlgorithm
 
 
-class Charset(Enum):
+class Charset(IntEnum):
     """String encoding"""
 
-    US_ASCII = auto()
+    US_ASCII = 1
     """US-ASCII"""
 
-    ISO_8859_1 = auto()
+    ISO_8859_1 = 2
     """ISO-8859-1"""
 
-    WINDOWS_1252 = auto()
+    WINDOWS_1252 = 3
     """Windows-1252"""
 
-    UTF_8 = auto()
+    UTF_8 = 4
     """UTF-8"""
 
-    UTF_16 = auto()
+    UTF_16 = 5
     """UTF-16"""
 
-    UTF_16LE = auto()
+    UTF_16LE = 6
     """UTF-16LE"""
 
-    UTF_16BE = auto()
+    UTF_16BE = 7
     """UTF-16BE"""
 
-    UTF_32 = auto()
+    UTF_32 = 8
     """UTF-32"""
 
-    UTF_32LE = auto()
+    UTF_32LE = 9
     """UTF-32LE"""
 
-    UTF_32BE = auto()
+    UTF_32BE = 10
     """UTF-16BE"""
 
 
-class FloatEncodingScheme(Enum):
+class FloatEncodingScheme(IntEnum):
     """Float encoding"""
 
-    IEEE754_1985 = auto()
+    IEEE754_1985 = 1
     """IEEE 754-1985"""
 
-    MILSTD_1750A = auto()
+    MILSTD_1750A = 2
     """MIL-STD-1750A"""
 
-    STRING = auto()
+    STRING = 3
     """
     String-encoded float
 
@@ -65,22 +65,22 @@ class FloatEncodingScheme(Enum):
     """
 
 
-class IntegerEncodingScheme(Enum):
+class IntegerEncodingScheme(IntEnum):
     """Integer encoding"""
 
-    UNSIGNED = auto()
+    UNSIGNED = 1
     """Unsigned"""
 
-    SIGN_MAGNITUDE = auto()
+    SIGN_MAGNITUDE = 2
     """Sign-magnitude"""
 
-    TWOS_COMPLEMENT = auto()
+    TWOS_COMPLEMENT = 3
     """Two's complement"""
 
-    ONES_COMPLEMENT = auto()
+    ONES_COMPLEMENT = 4
     """Ones' complement"""
 
-    STRING = auto()
+    STRING = 5
     """
     String-encoded integer
 
@@ -96,11 +96,15 @@ class IntegerEncodingScheme(Enum):
 
 
 class Encoding:
+    __slots__ = ("bits",)
+
     def __init__(self, bits: int | None = None) -> None:
         self.bits = bits
 
 
 class BinaryEncoding(Encoding):
+    __slots__ = ("length_bits", "encoder", "decoder")
+
     def __init__(
         self,
         bits: int | None = None,
@@ -127,6 +131,8 @@ class BinaryEncoding(Encoding):
 
 
 class IntegerEncoding(Encoding):
+    __slots__ = ("little_endian", "scheme", "string_encoding")
+
     def __init__(
         self,
         bits: int,
@@ -145,6 +151,8 @@ class IntegerEncoding(Encoding):
 
 
 class FloatEncoding(Encoding):
+    __slots__ = ("little_endian", "scheme", "string_encoding")
+
     def __init__(
         self,
         bits: int,
@@ -163,6 +171,8 @@ class FloatEncoding(Encoding):
 
 
 class FloatTimeEncoding(FloatEncoding):
+    __slots__ = ("offset", "scale")
+
     def __init__(
         self,
         bits: int,
@@ -181,6 +191,8 @@ class FloatTimeEncoding(FloatEncoding):
 
 
 class IntegerTimeEncoding(IntegerEncoding):
+    __slots__ = ("offset", "scale")
+
     def __init__(
         self,
         bits: int,
@@ -202,6 +214,8 @@ TimeEncoding: TypeAlias = FloatTimeEncoding | IntegerTimeEncoding
 
 
 class StringEncoding(Encoding):
+    __slots__ = ("length_bits", "max_bits", "charset", "termination")
+
     def __init__(
         self,
         bits: int | None = None,
@@ -253,9 +267,6 @@ uint7_t = IntegerEncoding(bits=7, scheme=IntegerEncodingScheme.UNSIGNED)
 int8_t = IntegerEncoding(bits=8, scheme=IntegerEncodingScheme.TWOS_COMPLEMENT)
 """Signed 8-bit integer in two's complement notation (big endian)"""
 
-uint8_t = IntegerEncoding(bits=8, scheme=IntegerEncodingScheme.UNSIGNED)
-"""Unsigned 8-bit integer (big endian)"""
-
 uint8_t = IntegerEncoding(bits=8, scheme=IntegerEncodingScheme.UNSIGNED)
 """Unsigned 8-bit integer"""
 
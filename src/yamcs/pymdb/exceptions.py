@@ -1,2 +1,6 @@
 class ExportError(Exception):
     """An error occurred while generating an export."""
+
+
+class DuplicateNameError(Exception):
+    """A system already contains an item with the same name."""
@@ -1,151 +1,151 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeAlias, Union
 
 if TYPE_CHECKING:
     from yamcs.pymdb.parameters import AggregateParameter, Member, Parameter
 
 
 class ParameterMember:
+    __slots__ = ("parameter", "path")
+
     def __init__(
         self,
         parameter: AggregateParameter,
-        path: Member | list[Member],
+        path: Member | Sequence[Member],
     ):
         self.parameter = parameter
 
         if isinstance(path, Sequence):
-            self.path: list[Member] = path
+            self.path: tuple[Member, ...] = tuple(path)
         else:
-            self.path: list[Member] = [path]
+            self.path: tuple[Member, ...] = (path,)
+
+
+ParameterRef: TypeAlias = Union["Parameter", ParameterMember, str]
 
 
 class Expression:
-    pass
+    __slots__ = ()
+
 
+class _CompoundExpression(Expression):
+    __slots__ = ("expressions",)
 
-class AndExpression(Expression):
     def __init__(
         self,
         expression1: Expression,
         expression2: Expression,
         *args: Expression,
     ) -> None:
-        self.expressions: list[Expression] = [
-            expression1,
-            expression2,
-            *args,
-        ]
+        expressions = (expression1, expression2, *args)
 
+        # Splice in children of the same kind, so that nested calls such as
+        # all_of(all_of(a, b), c) result in a single flat condition list.
+        kind = type(self)
+        if any(type(expression) is kind for expression in expressions):
+            expressions = tuple(
+                child
+                for expression in expressions
+                for child in (
+                    expression.expressions
+                    if type(expression) is kind
+                    else (expression,)
+                )
+            )
 
-class OrExpression(Expression):
-    def __init__(
-        self,
-        expression1: Expression,
-        expression2: Expression,
-        *args: Expression,
-    ) -> None:
-        self.expressions: list[Expression] = [
-            expression1,
-            expression2,
-            *args,
-        ]
+        self.expressions: tuple[Expression, ...] = expressions
 
 
-class EqExpression(Expression):
-    def __init__(
-        self,
-        ref: Parameter | ParameterMember | str,
-        value: Any,
-        calibrated: bool = True,
-    ):
-        self.ref: Parameter | ParameterMember | str = ref
-        self.value: Any = value
-        self.calibrated: bool = calibrated
+class AndExpression(_CompoundExpression):
+    """
+    Satisfied when all of the contained expressions are satisfied
+    """
 
+    __slots__ = ()
 
-class NeExpression(Expression):
-    def __init__(
-        self,
-        ref: Parameter | ParameterMember | str,
-        value: Any,
-        calibrated: bool = True,
-    ):
-        self.ref: Parameter | ParameterMember | str = ref
-        self.value: Any = value
-        self.calibrated: bool = calibrated
 
+class OrExpression(_CompoundExpression):
+    """
+    Satisfied when any of the contained expressions is satisfied
+    """
 
-class LtExpression(Expression):
-    def __init__(
-        self,
-        ref: Parameter | ParameterMember | str,
-        value: Any,
-        calibrated: bool = True,
-    ):
-        self.ref: Parameter | ParameterMember | str = ref
-        self.value: Any = value
-        self.calibrated: bool = calibrated
+    __slots__ = ()
 
 
-class LteExpression(Expression):
-    def __init__(
-        self,
-        ref: Parameter | ParameterMember | str,
-        value: Any,
-        calibrated: bool = True,
-    ):
-        self.ref: Parameter | ParameterMember | str = ref
-        self.value: Any = value
-        self.calibrated: bool = calibrated
+class ComparisonExpression(Expression):
+    """
+    Compares the value of a parameter against a constant value
+    """
+
+    __slots__ = ("ref", "value", "calibrated")
 
+    operator: str
+    """Comparison operator, as used in XTCE"""
 
-class GtExpression(Expression):
     def __init__(
         self,
-        ref: Parameter | ParameterMember | str,
+        ref: ParameterRef,
         value: Any,
         calibrated: bool = True,
     ):
-        self.ref: Parameter | ParameterMember | str = ref
+        self.ref: ParameterRef = ref
         self.value: Any = value
         self.calibrated: bool = calibrated
 
 
-class GteExpression(Expression):
-    def __init__(
-        self,
-        ref: Parameter | ParameterMember | str,
-        value: Any,
-        calibrated: bool = True,
-    ):
-        self.ref: Parameter | ParameterMember | str = ref
-        self.value: Any = value
-        self.calibrated: bool = calibrated
+class EqExpression(ComparisonExpression):
+    __slots__ = ()
+    operator = "=="
+
+
+class NeExpression(ComparisonExpression):
+    __slots__ = ()
+    operator = "!="
+
+
+class LtExpression(ComparisonExpression):
+    __slots__ = ()
+    operator = "<"
+
+
+class LteExpression(ComparisonExpression):
+    __slots__ = ()
+    operator = "<="
+
+
+class GtExpression(ComparisonExpression):
+    __slots__ = ()
+    operator = ">"
+
+
+class GteExpression(ComparisonExpression):
+    __slots__ = ()
+    operator = ">="
 
 
-def eq(ref: Parameter | ParameterMember | str, value: Any, calibrated=True):
+def eq(ref: ParameterRef, value: Any, calibrated=True):
     return EqExpression(ref, value, calibrated)
 
 
-def ne(ref: Parameter | ParameterMember | str, value: Any, calibrated=True):
+def ne(ref: ParameterRef, value: Any, calibrated=True):
     return NeExpression(ref, value, calibrated)
 
 
-def lt(ref: Parameter | ParameterMember | str, value: Any, calibrated=True):
+def lt(ref: ParameterRef, value: Any, calibrated=True):
     return LtExpression(ref, value, calibrated)
 
 
-def lte(ref: Parameter | ParameterMember | str, value: Any, calibrated=True):
+def lte(ref: ParameterRef, value: Any, calibrated=True):
     return LteExpression(ref, value, calibrated)
 
 
-def gt(ref: Parameter | ParameterMember | str, value: Any, calibrated=True):
+def gt(ref: ParameterRef, value: Any, calibrated=True):
     return GtExpression(ref, value, calibrated)
 
 
-def gte(ref: Parameter | ParameterMember | str, value: Any, calibrated=True):
+def gte(ref: ParameterRef, value: Any, calibrated=True):
     return GteExpression(ref, value, calibrated)
 
 
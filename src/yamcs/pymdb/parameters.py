@@ -1,11 +1,11 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import Mapping, Sequence
 from datetime import datetime
-from enum import Enum, auto
+from enum import IntEnum
 from typing import TYPE_CHECKING, Any, Literal
 
-from yamcs.pymdb.alarms import EnumerationAlarm, ThresholdAlarm
 from yamcs.pymdb.datatypes import (
     AbsoluteTimeDataType,
     AggregateDataType,
@@ -22,41 +22,46 @@ from yamcs.pymdb.datatypes import (
     Member,
     StringDataType,
 )
-from yamcs.pymdb.encodings import Encoding, TimeEncoding
 
 if TYPE_CHECKING:
-    from yamcs.pymdb.alarms import EnumerationContextAlarm, ThresholdContextAlarm
+    from yamcs.pymdb.alarms import (
+        EnumerationAlarm,
+        EnumerationContextAlarm,
+        ThresholdAlarm,
+        ThresholdContextAlarm,
+    )
     from yamcs.pymdb.calibrators import Calibrator
+    from yamcs.pymdb.encodings import Encoding, TimeEncoding
     from yamcs.pymdb.systems import System
 
 
-class DataSource(Enum):
+class DataSource(IntEnum):
     """
     The nature of the source entity for which a parameter receives a value
     """
 
-    TELEMETERED = auto()
+    TELEMETERED = 1
     """A telemetered parameter is one that will have values in telemetry"""
 
-    DERIVED = auto()
+    DERIVED = 2
     """
     A derived parameter is one that is calculated, usually by an
     :class:`Algorithm`
     """
 
-    CONSTANT = auto()
+    CONSTANT = 3
     """
     A constant parameter is one that is used as a constant in the system
     (e.g. a vehicle id)
     """
 
-    LOCAL = auto()
+    LOCAL = 4
     """
     A local parameter is one that is used purely by the software locally
     (e.g. a ground command counter)
     """
 
-    GROUND = auto()
+    GROUND = 5
     """
     A ground parameter is one that is generated by an asset which is not the
     spacecraft
@@ -106,13 +111,15 @@ class Parameter(DataType):
             units=units,
             encoding=encoding,
         )
-        self.name: str = name
+        self.name: str = sys.intern(str(name)) if isinstance(name, str) else name
         """Short name of this parameter"""
 
         self.system: System = system
         """System this parameter belongs to"""
 
-        self.aliases: dict[str, str] = dict(aliases or {})
+        self._qualified_name: str | None = None
+
+        self.aliases: dict[str, str] = dict(aliases) if aliases else {}
         """Alternative names, keyed by namespace"""
 
         self.data_source: DataSource = data_source
@@ -133,9 +140,7 @@ class Parameter(DataType):
         used once (when there is no other value to persist).
         """
 
-        if name in system._parameters_by_name:
-            raise Exception(f"System already contains a parameter {name}")
-        system._parameters_by_name[name] = self
+        system._register(system._parameters_by_name, "a parameter", self)
 
     @property
     def qualified_name(self) -> str:
@@ -144,14 +149,9 @@ class Parameter(DataType):
         an item ``C`` in a subystem ``B`` of a top-level system ``A`` is
         represented as ``/A/B/C``
         """
-        path = "/" + self.name
-
-        parent = self.system
-        while parent:
-            path = "/" + parent.name + path
-            parent = getattr(parent, "system", None)
-
-        return path
+        if self._qualified_name is None:
+            self._qualified_name = self.system.qualified_name + "/" + self.name
+        return self._qualified_name
 
     def __lt__(self, other: Parameter) -> bool:
         return self.qualified_name < other.qualified_name
@@ -408,7 +408,9 @@ class EnumeratedParameter(Parameter, EnumeratedDataType):
         self.alarm: EnumerationAlarm | None = alarm
         """Specification for alarm monitoring"""
 
-        self.context_alarms: list[EnumerationContextAlarm] = list(context_alarms or [])
+        self.context_alarms: list[EnumerationContextAlarm] = (
+            list(context_alarms) if context_alarms else []
+        )
         """Alarm specification when a specific context expression applies"""
 
 
@@ -466,7 +468,9 @@ class FloatParameter(Parameter, FloatDataType):
         self.alarm: ThresholdAlarm | None = alarm
         """Specification for alarm monitoring"""
 
-        self.context_alarms: list[ThresholdContextAlarm] = list(context_alarms or [])
+        self.context_alarms: list[ThresholdContextAlarm] = (
+            list(context_alarms) if context_alarms else []
+        )
         """Alarm specification when a specific context expression applies"""
 
 
@@ -522,7 +526,9 @@ class IntegerParameter(Parameter, IntegerDataType):
         self.alarm: ThresholdAlarm | None = alarm
         """Specification for alarm monitoring"""
 
-        self.context_alarms: list[ThresholdContextAlarm] = list(context_alarms or [])
+        self.context_alarms: list[ThresholdContextAlarm] = (
+            list(context_alarms) if context_alarms else []
+        )
         """Alarm specification when a specific context expression applies"""
 
 
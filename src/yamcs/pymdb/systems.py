@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import Mapping
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from yamcs.pymdb import xtce
+from yamcs.pymdb.exceptions import DuplicateNameError
 
 if TYPE_CHECKING:
     from yamcs.pymdb.algorithms import Algorithm
@@ -25,6 +26,21 @@ class System:
     A system may have child :class:`.Subsystem`\\s, forming a system tree.
     """
 
+    __slots__ = (
+        "name",
+        "aliases",
+        "short_description",
+        "long_description",
+        "extra",
+        "_algorithms_by_name",
+        "_commands_by_name",
+        "_containers_by_name",
+        "_parameters_by_name",
+        "_subsystems_by_name",
+        "_qualified_name",
+        "_sorted_cache",
+    )
+
     def __init__(
         self,
         name: str,
@@ -33,10 +49,10 @@ class System:
         long_description: str | None = None,
         extra: Mapping[str, str] | None = None,
     ):
-        self.name: str = name
+        self.name: str = sys.intern(str(name)) if isinstance(name, str) else name
         """Short name of this system"""
 
-        self.aliases: dict[str, str] = dict(aliases or {})
+        self.aliases: dict[str, str] = dict(aliases) if aliases else {}
         """Alternative names, keyed by namespace"""
 
         self.short_description: str | None = short_description
@@ -45,7 +61,7 @@ class System:
         self.long_description: str | None = long_description
         """Multiline description"""
 
-        self.extra: dict[str, str] = dict(extra or {})
+        self.extra: dict[str, str] = dict(extra) if extra else {}
         """Arbitrary information, keyed by name"""
 
         self._algorithms_by_name: dict[str, Algorithm] = {}
@@ -54,6 +70,12 @@ class System:
         self._parameters_by_name: dict[str, Parameter] = {}
         self._subsystems_by_name: dict[str, Subsystem] = {}
 
+        self._qualified_name: str = "/" + self.name
+
+        # Sorted items, keyed by collection name. Cleared on every
+        # registration or removal.
+        self._sorted_cache: dict[str, tuple[Any, ...]] = {}
+
     @property
     def root(self) -> System:
         """
@@ -63,52 +85,45 @@ class System:
 
     @property
     def qualified_name(self) -> str:
-        return "/" + self.name
+        """
+        Fully qualified name of this system (absolute path)
+        """
+        return self._qualified_name
 
     @property
     def containers(self) -> list[Container]:
         """
         Containers directly belonging to this system
         """
-        copy = list(self._containers_by_name.values())
-        copy.sort()
-        return copy
+        return self._sorted("containers", self._containers_by_name)
 
     @property
     def commands(self) -> list[Command]:
         """
         Commands directly belonging to this system
         """
-        copy = list(self._commands_by_name.values())
-        copy.sort()
-        return copy
+        return self._sorted("commands", self._commands_by_name)
 
     @property
     def parameters(self) -> list[Parameter]:
         """
         Parameters directly belonging to this system
         """
-        copy = list(self._parameters_by_name.values())
-        copy.sort()
-        return copy
+        return self._sorted("parameters", self._parameters_by_name)
 
     @property
     def algorithms(self) -> list[Algorithm]:
         """
         Algorithms directly belonging to this system
         """
-        copy = list(self._algorithms_by_name.values())
-        copy.sort()
-        return copy
+        return self._sorted("algorithms", self._algorithms_by_name)
 
     @property
     def subsystems(self) -> list[Subsystem]:
         """
         Subsystems directly belonging to this system
         """
-        copy = list(self._subsystems_by_name.values())
-        copy.sort()
-        return copy
+        return self._sorted("subsystems", self._subsystems_by_name)
 
     def remove_parameter(self, name: str) -> bool:
         """
@@ -116,11 +131,10 @@ class System:
 
         Raises an exception if no such parameter exists
         """
-        try:
-            self._parameters_by_name.pop(name)
-            return True
-        except KeyError:
+        if self._parameters_by_name.pop(name, None) is None:
             return False
+        self._sorted_cache.clear()
+        return True
 
     def remove_command(self, name: str) -> bool:
         """
@@ -128,11 +142,10 @@ class System:
 
         Raises an exception if no such command exists
         """
-        try:
-            self._commands_by_name.pop(name)
-            return True
-        except KeyError:
+        if self._commands_by_name.pop(name, None) is None:
             return False
+        self._sorted_cache.clear()
+        return True
 
     def remove_container(self, name: str) -> bool:
         """
@@ -140,11 +153,10 @@ class System:
 
         Raises an exception if no such container exists
         """
-        try:
-            self._containers_by_name.pop(name)
-            return True
-        except KeyError:
+        if self._containers_by_name.pop(name, None) is None:
             return False
+        self._sorted_cache.clear()
+        return True
 
     def remove_algorithm(self, name: str) -> bool:
         """
@@ -152,11 +164,10 @@ class System:
 
         Raises an exception if no such algorithm exists
         """
-        try:
-            self._algorithms_by_name.pop(name)
-            return True
-        except KeyError:
+        if self._algorithms_by_name.pop(name, None) is None:
             return False
+        self._sorted_cache.clear()
+        return True
 
     def remove_subsystem(self, name: str) -> bool:
         """
@@ -164,11 +175,10 @@ class System:
 
         Raises an exception if no such subsystem exists
         """
-        try:
-            self._subsystems_by_name.pop(name)
-            return True
-        except KeyError:
+        if self._subsystems_by_name.pop(name, None) is None:
             return False
+        self._sorted_cache.clear()
+        return True
 
     def find_parameter(self, name: str) -> Parameter:
         """
@@ -221,11 +231,34 @@ class System:
         """
         Serialize this system to an XTCE formatted string
         """
+        # Imported here, so that building a model does not load the exporter
+        from yamcs.pymdb import xtce
+
         return xtce.XTCE12Generator(self).to_xtce(
             indent=indent,
             top_comment=top_comment,
         )
 
+    def _register(self, items: dict[str, Any], kind: str, item: Any) -> None:
+        # Inserts and checks for a duplicate name in a single dict probe
+        if items.setdefault(item.name, item) is not item:
+            raise DuplicateNameError(
+                f"System {self.qualified_name} already contains {kind} {item.name}"
+            )
+        self._sorted_cache.clear()
+
+    def _sorted(self, key: str, items: dict[str, Any]) -> list[Any]:
+        # Sorts on the dict keys. These are the item names, and siblings share
+        # the same path prefix, so this matches the qualified-name order of
+        # __lt__ without calling it. The result is cached until the next
+        # change, and a copy is returned so callers may modify it.
+        try:
+            cached = self._sorted_cache[key]
+        except KeyError:
+            cached = tuple(items[name] for name in sorted(items))
+            self._sorted_cache[key] = cached
+        return list(cached)
+
     def __lt__(self, other: System) -> bool:
         return self.qualified_name < other.qualified_name
 
@@ -239,6 +272,8 @@ class Subsystem(System):
     to its parent system.
     """
 
+    __slots__ = ("system", "_root")
+
     def __init__(
         self,
         system: System,
@@ -259,43 +294,16 @@ class Subsystem(System):
         self.system: System = system
         """Parent system"""
 
-        if name in system._subsystems_by_name:
-            raise Exception(
-                "System {} already contains a subsystem {}".format(
-                    system.qualified_name, name
-                )
-            )
+        # A subsystem cannot be moved, so resolve these once from the
+        # (already resolved) parent.
+        self._root: System = system.root
+        self._qualified_name: str = system.qualified_name + "/" + self.name
 
-        system._subsystems_by_name[name] = self
+        system._register(system._subsystems_by_name, "a subsystem", self)
 
     @property
     def root(self) -> System:
         """
         The top-most system
         """
-        parent = self.system
-        while parent:
-            if isinstance(parent, Subsystem):
-                parent = parent.system
-            else:
-                return parent
-
-        return parent
-
-    @property
-    def qualified_name(self) -> str:
-        """
-        Fully qualified name of this system (absolute path)
-        """
-        path = "/" + self.name
-
-        parent = self.system
-        while parent:
-            path = "/" + parent.name + path
-
-            if isinstance(parent, Subsystem):
-                parent = parent.system
-            else:
-                parent = None
-
-        return path
+        return self._root
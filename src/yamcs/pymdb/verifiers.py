@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from enum import Enum, auto
+from enum import IntEnum
 from typing import TYPE_CHECKING, TypeAlias
 
 if TYPE_CHECKING:
@@ -11,22 +11,28 @@ if TYPE_CHECKING:
     from yamcs.pymdb.parameters import Parameter
 
 
-class TerminationAction(Enum):
-    SUCCESS = auto()
-    FAIL = auto()
+class TerminationAction(IntEnum):
+    SUCCESS = 1
+    FAIL = 2
 
 
 class AlgorithmCheck:
+    __slots__ = ("algorithm",)
+
     def __init__(self, algorithm: UnnamedAlgorithm):
         self.algorithm = algorithm
 
 
 class ContainerCheck:
+    __slots__ = ("container",)
+
     def __init__(self, container: Container):
         self.container = container
 
 
 class ExpressionCheck:
+    __slots__ = ("expression",)
+
     def __init__(self, expression: Expression):
         self.expression = expression
 
@@ -34,7 +40,7 @@ class ExpressionCheck:
 Check: TypeAlias = AlgorithmCheck | ContainerCheck | ExpressionCheck
 
 
-@dataclass
+@dataclass(slots=True)
 class Verifier:
     check: Check
     """Check to perform"""
@@ -57,11 +63,11 @@ class Verifier:
     on_timeout: TerminationAction | None = None
     """What it means for the whole command, when this single verifier times out"""
 
-    extra: dict[str, str] = field(default_factory=lambda: {})
+    extra: dict[str, str] = field(default_factory=dict)
     """Arbitrary information, keyed by name"""
 
 
-@dataclass
+@dataclass(slots=True)
 class TransferredToRangeVerifier(Verifier):
     """
     A verifier that checks whether the command has been received to the network
@@ -75,7 +81,7 @@ class TransferredToRangeVerifier(Verifier):
     """What it means for the whole command, when this single verifier fails"""
 
 
-@dataclass
+@dataclass(slots=True)
 class SentFromRangeVerifier(Verifier):
     """
     A verifier that checks whether the command been transmitted to the
@@ -90,7 +96,7 @@ class SentFromRangeVerifier(Verifier):
     """What it means for the whole command, when this single verifier fails"""
 
 
-@dataclass
+@dataclass(slots=True)
 class ReceivedVerifier(Verifier):
     """
     A verifier that checks that the system has received the command
@@ -100,7 +106,7 @@ class ReceivedVerifier(Verifier):
     """What it means for the whole command, when this single verifier fails"""
 
 
-@dataclass
+@dataclass(slots=True)
 class AcceptedVerifier(Verifier):
     """
     A verifier that checks that the system has accepted the command
@@ -110,7 +116,7 @@ class AcceptedVerifier(Verifier):
     """What it means for the whole command, when this single verifier fails"""
 
 
-@dataclass
+@dataclass(slots=True)
 class QueuedVerifier(Verifier):
     """
     A verifier that checks that the command is scheduled for execution by
@@ -121,7 +127,7 @@ class QueuedVerifier(Verifier):
     """What it means for the whole command, when this single verifier fails"""
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionVerifier(Verifier):
     """
     A verifier that checks that the command is being executed.
@@ -131,7 +137,7 @@ class ExecutionVerifier(Verifier):
     """What it means for the whole command, when this single verifier fails"""
 
 
-@dataclass
+@dataclass(slots=True)
 class CompleteVerifier(Verifier):
     """
     A verifier that checks whether the command to be considered completed
@@ -146,7 +152,7 @@ class CompleteVerifier(Verifier):
     return_parameter: Parameter | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FailedVerifier(Verifier):
     """
     A verifier that checks that the command failed.
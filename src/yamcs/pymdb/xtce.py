@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import os
+import re
 import xml.etree.ElementTree as ET
 from binascii import hexlify
 from collections.abc import Mapping
 from datetime import datetime, timezone
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Sequence, cast
-from xml.dom import minidom
 
 from yamcs.pymdb.alarms import AlarmLevel, ThresholdAlarm, ThresholdContextAlarm
 from yamcs.pymdb.algorithms import (
@@ -70,15 +70,11 @@ from yamcs.pymdb.encodings import (
 from yamcs.pymdb.exceptions import ExportError
 from yamcs.pymdb.expressions import (
     AndExpression,
-    EqExpression,
+    ComparisonExpression,
     Expression,
-    GteExpression,
-    GtExpression,
-    LteExpression,
-    LtExpression,
-    NeExpression,
     OrExpression,
     ParameterMember,
+    ParameterRef,
 )
 from yamcs.pymdb.parameters import (
     AbsoluteTimeParameter,
@@ -112,6 +108,33 @@ if TYPE_CHECKING:
     from yamcs.pymdb.systems import System
 
 
+_CHARSETS: dict[Charset, str] = {
+    Charset.US_ASCII: "US-ASCII",
+    Charset.ISO_8859_1: "ISO-8859-1",
+    Charset.WINDOWS_1252: "Windows-1252",
+    Charset.UTF_8: "UTF-8",
+    Charset.UTF_16: "UTF-16",
+    Charset.UTF_16LE: "UTF-16LE",
+    Charset.UTF_16BE: "UTF-16BE",
+    Charset.UTF_32: "UTF-32",
+    Charset.UTF_32LE: "UTF-32LE",
+    Charset.UTF_32BE: "UTF-32BE",
+}
+
+_INTEGER_ENCODING_SCHEMES: dict[IntegerEncodingScheme, str] = {
+    IntegerEncodingScheme.UNSIGNED: "unsigned",
+    IntegerEncodingScheme.SIGN_MAGNITUDE: "signMagnitude",
+    IntegerEncodingScheme.TWOS_COMPLEMENT: "twosComplement",
+    IntegerEncodingScheme.ONES_COMPLEMENT: "onesComplement",
+}
+
+_FLOAT_ENCODING_SCHEMES: dict[FloatEncodingScheme, str] = {
+    FloatEncodingScheme.IEEE754_1985: "IEEE754_1985",
+    FloatEncodingScheme.MILSTD_1750A: "MILSTD_1750A",
+    FloatEncodingScheme.STRING: "STRING",
+}
+
+
 def _to_xml_value(value: Any):
     if isinstance(value, (bytes, bytearray)):
         return hexlify(value).decode("ascii")
@@ -136,10 +159,79 @@ def _to_isoduration(seconds: float):
     return "P" + (str(d) + "D" if d else "") + sep + (t if seconds else "T0S")
 
 
+# Characters outside the XML 1.0 Char production
+_INVALID_XML_CHARS = re.compile(
+    "[^\t\n\r\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]"
+)
+
+
+def _check_xml_chars(data: str):
+    match = _INVALID_XML_CHARS.search(data)
+    if match:
+        raise ExportError(
+            f"Character {match.group()!r} is not allowed in XML: {data!r}"
+        )
+
+
+def _escape_xml_attrib(data: str) -> str:
+    _check_xml_chars(data)
+    # Whitespace other than spaces is escaped, because a parser would
+    # otherwise normalize it to a space
+    return (
+        data.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace('"', "&quot;")
+        .replace(">", "&gt;")
+        .replace("\n", "&#10;")
+        .replace("\r", "&#13;")
+        .replace("\t", "&#9;")
+    )
+
+
+def _escape_xml_text(data: str) -> str:
+    _check_xml_chars(data)
+    # An XML parser reads any line ending as a single newline
+    if "\r" in data:
+        data = data.replace("\r\n", "\n").replace("\r", "\n")
+    return (
+        data.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace('"', "&quot;")
+        .replace(">", "&gt;")
+    )
+
+
+def _write_pretty_xml(out: list[str], el: ET.Element, indent: str, addindent: str):
+    # Writes the same layout as minidom's toprettyxml, but directly from the
+    # ElementTree, without serializing and parsing the document first.
+    tag = el.tag
+    out.append(indent + "<" + tag)
+    for name, value in el.attrib.items():
+        out.append(f' {name}="{_escape_xml_attrib(value)}"')
+
+    text = el.text
+    if len(el):
+        out.append(">\n")
+        child_indent = indent + addindent
+        if text:
+            out.append(child_indent + _escape_xml_text(text) + "\n")
+        for child in el:
+            _write_pretty_xml(out, child, child_indent, addindent)
+        out.append(f"{indent}</{tag}>\n")
+    elif text:
+        out.append(f">{_escape_xml_text(text)}</{tag}>\n")
+    else:
+        out.append("/>\n")
+
+
 class XTCE12Generator:
     def __init__(self, system: System):
         self.system = system
 
+        # Rendered attributes of numeric encodings. Common encodings (uint8_t, ...)
+        # are shared by many data types, so only render them once per export.
+        self._encoding_attrib: dict[Encoding, dict[str, str]] = {}
+
     def to_xtce(
         self,
         indent="",
@@ -150,8 +242,7 @@ class XTCE12Generator:
             self.system,
             add_schema_location=add_schema_location,
         )
-        xtce = ET.tostring(el, encoding="unicode")
-        xtce_dom = minidom.parseString(xtce)
+        out = ['<?xml version="1.0" ?>\n']
 
         if top_comment is True:
             top_comment = (
@@ -159,9 +250,13 @@ class XTCE12Generator:
                 "See https://github.com/yamcs/pymdb\n"
             )
         if top_comment:
-            comment_el = xtce_dom.createComment(top_comment)
-            xtce_dom.insertBefore(comment_el, xtce_dom.firstChild)
-        return xtce_dom.toprettyxml(indent=indent)
+            if "--" in top_comment:
+                raise ValueError("'--' is not allowed in a comment node")
+            _check_xml_chars(top_comment)
+            out.append(f"<!--{top_comment}-->\n")
+
+        _write_pretty_xml(out, el, "", indent)
+        return "".join(out)
 
     def add_command_metadata(self, parent: ET.Element, system: System):
         el = ET.SubElement(parent, "CommandMetaData")
@@ -461,11 +556,7 @@ class XTCE12Generator:
         hex = hexlify(entry.binary).decode("ascii")
 
         # XTCE requires hex to be at least as large as the bit size
-        bytelen: int
-        if bitlen % 8:
-            bytelen = (bitlen + (8 - bitlen % 8)) // 8
-        else:
-            bytelen = bitlen // 8
+        bytelen = (bitlen + 7) // 8
         hex = hex.zfill(bytelen * 2)
 
         el.attrib["binaryValue"] = hex
@@ -536,19 +627,21 @@ class XTCE12Generator:
         self.add_algorithm_set(el, system)
 
     def add_algorithm_set(self, parent: ET.Element, system: System):
-        if not system.algorithms:
+        algorithms = system.algorithms
+        if not algorithms:
             return
 
         el = ET.SubElement(parent, "AlgorithmSet")
-        for algorithm in system.algorithms:
+        for algorithm in algorithms:
             self.add_custom_algorithm(el, system, algorithm)
 
     def add_parameter_type_set(self, parent: ET.Element, system: System):
-        if not system.parameters:
+        parameters = system.parameters
+        if not parameters:
             return
 
         el = ET.SubElement(parent, "ParameterTypeSet")
-        for parameter in system.parameters:
+        for parameter in parameters:
             if isinstance(parameter, AbsoluteTimeParameter):
                 self.add_absolute_time_parameter_type(
                     el,
@@ -1616,28 +1709,10 @@ class XTCE12Generator:
     def add_string_data_encoding(self, parent: ET.Element, encoding: StringEncoding):
         el = ET.SubElement(parent, "StringDataEncoding")
 
-        if encoding.charset == Charset.US_ASCII:
-            el.attrib["encoding"] = "US-ASCII"
-        elif encoding.charset == Charset.ISO_8859_1:
-            el.attrib["encoding"] = "ISO-8859-1"
-        elif encoding.charset == Charset.WINDOWS_1252:
-            el.attrib["encoding"] = "Windows-1252"
-        elif encoding.charset == Charset.UTF_8:
-            el.attrib["encoding"] = "UTF-8"
-        elif encoding.charset == Charset.UTF_16:
-            el.attrib["encoding"] = "UTF-16"
-        elif encoding.charset == Charset.UTF_16LE:
-            el.attrib["encoding"] = "UTF-16LE"
-        elif encoding.charset == Charset.UTF_16BE:
-            el.attrib["encoding"] = "UTF-16BE"
-        elif encoding.charset == Charset.UTF_32:
-            el.attrib["encoding"] = "UTF-32"
-        elif encoding.charset == Charset.UTF_32LE:
-            el.attrib["encoding"] = "UTF-32LE"
-        elif encoding.charset == Charset.UTF_32BE:
-            el.attrib["encoding"] = "UTF-32BE"
-        else:
-            raise Exception(f"Unexpected charset {encoding.charset}")
+        try:
+            el.attrib["encoding"] = _CHARSETS[encoding.charset]
+        except KeyError:
+            raise Exception(f"Unexpected charset {encoding.charset}") from None
 
         if encoding.bits is not None:
             size_el = ET.SubElement(el, "SizeInBits")
@@ -1690,28 +1765,28 @@ class XTCE12Generator:
         encoding: IntegerEncoding,
         calibrator: Calibrator | None,
     ):
-        el = ET.SubElement(parent, "IntegerDataEncoding")
-        el.attrib["sizeInBits"] = str(encoding.bits)
-
-        if encoding.scheme == IntegerEncodingScheme.UNSIGNED:
-            el.attrib["encoding"] = "unsigned"
-        elif encoding.scheme == IntegerEncodingScheme.SIGN_MAGNITUDE:
-            el.attrib["encoding"] = "signMagnitude"
-        elif encoding.scheme == IntegerEncodingScheme.TWOS_COMPLEMENT:
-            el.attrib["encoding"] = "twosComplement"
-        elif encoding.scheme == IntegerEncodingScheme.ONES_COMPLEMENT:
-            el.attrib["encoding"] = "onesComplement"
-
-        if (encoding.bits is not None) and (encoding.bits > 8):
-            if encoding.little_endian:
-                el.attrib["byteOrder"] = "leastSignificantByteFirst"
-            else:
-                el.attrib["byteOrder"] = "mostSignificantByteFirst"
+        attrib = self._encoding_attrib.get(encoding)
+        if attrib is None:
+            attrib = {"sizeInBits": str(encoding.bits)}
+
+            scheme = _INTEGER_ENCODING_SCHEMES.get(encoding.scheme)
+            if scheme:
+                attrib["encoding"] = scheme
+
+            if (encoding.bits is not None) and (encoding.bits > 8):
+                if encoding.little_endian:
+                    attrib["byteOrder"] = "leastSignificantByteFirst"
+                else:
+                    attrib["byteOrder"] = "mostSignificantByteFirst"
+
+            self._encoding_attrib[encoding] = attrib
+
+        el = ET.SubElement(parent, "IntegerDataEncoding", attrib)
 
         if calibrator:
             self.add_calibrator(el, calibrator)
 
-        if encoding.scheme == IntegerEncodingScheme.STRING and encoding.string_encoding:
+        if encoding.scheme is IntegerEncodingScheme.STRING and encoding.string_encoding:
             self.add_string_data_encoding(el, encoding.string_encoding)
 
     def add_float_data_encoding(
@@ -1720,25 +1795,27 @@ class XTCE12Generator:
         encoding: FloatEncoding,
         calibrator: Calibrator | None,
     ):
-        el = ET.SubElement(parent, "FloatDataEncoding")
-        el.attrib["sizeInBits"] = str(encoding.bits)
-
-        if encoding.scheme == FloatEncodingScheme.IEEE754_1985:
-            el.attrib["encoding"] = "IEEE754_1985"
-        elif encoding.scheme == FloatEncodingScheme.MILSTD_1750A:
-            el.attrib["encoding"] = "MILSTD_1750A"
-        elif encoding.scheme == FloatEncodingScheme.STRING:
-            el.attrib["encoding"] = "STRING"
-
-        if encoding.little_endian:
-            el.attrib["byteOrder"] = "leastSignificantByteFirst"
-        else:
-            el.attrib["byteOrder"] = "mostSignificantByteFirst"
+        attrib = self._encoding_attrib.get(encoding)
+        if attrib is None:
+            attrib = {"sizeInBits": str(encoding.bits)}
+
+            scheme = _FLOAT_ENCODING_SCHEMES.get(encoding.scheme)
+            if scheme:
+                attrib["encoding"] = scheme
+
+            if encoding.little_endian:
+                attrib["byteOrder"] = "leastSignificantByteFirst"
+            else:
+                attrib["byteOrder"] = "mostSignificantByteFirst"
+
+            self._encoding_attrib[encoding] = attrib
+
+        el = ET.SubElement(parent, "FloatDataEncoding", attrib)
 
         if calibrator:
             self.add_calibrator(el, calibrator)
 
-        if encoding.scheme == FloatEncodingScheme.STRING and encoding.string_encoding:
+        if encoding.scheme is FloatEncodingScheme.STRING and encoding.string_encoding:
             self.add_string_data_encoding(el, encoding.string_encoding)
 
     def add_calibrator(self, parent: ET.Element, calibrator: Calibrator):
@@ -1775,11 +1852,12 @@ class XTCE12Generator:
                 enumeration_el.attrib["label"] = choice.name
 
     def add_parameter_set(self, parent: ET.Element, system: System):
-        if not system.parameters:
+        parameters = system.parameters
+        if not parameters:
             return
 
         el = ET.SubElement(parent, "ParameterSet")
-        for parameter in system.parameters:
+        for parameter in parameters:
             parameter_el = ET.SubElement(el, "Parameter")
             parameter_el.attrib["name"] = parameter.name
             parameter_el.attrib["parameterTypeRef"] = parameter.name
@@ -1815,11 +1893,12 @@ class XTCE12Generator:
             props_el.attrib["persistence"] = "true" if parameter.persistent else "false"
 
     def add_container_set(self, parent: ET.Element, system: System):
-        if not system.containers:
+        containers = system.containers
+        if not containers:
             return
 
         el = ET.SubElement(parent, "ContainerSet")
-        for container in system.containers:
+        for container in containers:
             self.add_sequence_container(el, container)
 
     def add_custom_algorithm(
@@ -1896,58 +1975,13 @@ class XTCE12Generator:
         system: System,
         expression: Expression,
     ):
-        if isinstance(expression, EqExpression):
+        if isinstance(expression, ComparisonExpression):
             self.add_condition(
                 parent,
                 system,
                 expression.ref,
                 expression.value,
-                "==",
-                expression.calibrated,
-            )
-        elif isinstance(expression, NeExpression):
-            self.add_condition(
-                parent,
-                system,
-                expression.ref,
-                expression.value,
-                "!=",
-                expression.calibrated,
-            )
-        elif isinstance(expression, LtExpression):
-            self.add_condition(
-                parent,
-                system,
-                expression.ref,
-                expression.value,
-                "<",
-                expression.calibrated,
-            )
-        elif isinstance(expression, LteExpression):
-            self.add_condition(
-                parent,
-                system,
-                expression.ref,
-                expression.value,
-                "<=",
-                expression.calibrated,
-            )
-        elif isinstance(expression, GtExpression):
-            self.add_condition(
-                parent,
-                system,
-                expression.ref,
-                expression.value,
-                ">",
-                expression.calibrated,
-            )
-        elif isinstance(expression, GteExpression):
-            self.add_condition(
-                parent,
-                system,
-                expression.ref,
-                expression.value,
-                ">=",
+                expression.operator,
                 expression.calibrated,
             )
         elif isinstance(expression, AndExpression):
@@ -1965,7 +1999,7 @@ class XTCE12Generator:
         self,
         parent: ET.Element,
         system: System,
-        ref: Parameter | ParameterMember | str,
+        ref: ParameterRef,
         value: Any,
         operator: str,
         calibrated: bool,
@@ -2085,9 +2119,7 @@ class XTCE12Generator:
         else:
             return target
 
-    def make_parameter_ref(
-        self, target: Parameter | ParameterMember | str, start: System
-    ):
+    def make_parameter_ref(self, target: ParameterRef, start: System):
         if isinstance(target, Parameter):
             return self.make_ref(target.qualified_name, start)
         elif isinstance(target, ParameterMember):